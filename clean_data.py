@@ -6,44 +6,30 @@ Date: January 2026
 """
 
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # files only, no GUI backend to initialise
 import matplotlib.pyplot as plt
-import seaborn as sns
+from numba import njit, prange
+import xlsxwriter
 import os
 from pathlib import Path
 
 
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 10
-
-# Create directories for outputs
-Path("cleaned_data").mkdir(exist_ok=True)
-Path("images").mkdir(exist_ok=True)
-
-print("="*80)
-print("EPA WALKABILITY INDEX - DATA CLEANING PIPELINE")
-print("="*80)
-
-# STEP 1: LOAD THE RAW DATA
-print("\n[STEP 1] Loading raw data...")
-
-# Update this path to your actual file location
-input_file = "for_claude.xlsx"  
-
-df_raw = pd.read_csv(input_file)
-print(f"✓ Loaded {len(df_raw):,} rows and {len(df_raw.columns)} columns")
-
-# Save raw data info
-with open("images/step1_raw_data_info.txt", "w") as f:
-    f.write(f"Raw Dataset Information\n")
-    f.write(f"{'='*50}\n")
-    f.write(f"Total Rows: {len(df_raw):,}\n")
-    f.write(f"Total Columns: {len(df_raw.columns)}\n")
-    f.write(f"Memory Usage: {df_raw.memory_usage(deep=True).sum() / 1024**2:.2f} MB\n")
+# White background with a light grid behind the data
+plt.rcParams.update({
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'grid.linestyle': '-',
+    'grid.alpha': 0.3,
+    'figure.figsize': (12, 6),
+    'font.size': 10,
+})
 
-# STEP 2: SELECT RELEVANT COLUMNS
-print("\n[STEP 2] Selecting relevant columns...")
+# Diagnostic plots (steps 2-8) don't need print resolution
+DIAG_DPI = 120
 
 # Key variables for walkability analysis
 key_columns = [
@@ -72,377 +58,490 @@ key_columns = [
     'Pct_AO0', 'Pct_AO1', 'Pct_AO2p'
 ]
 
-df = df_raw[key_columns].copy()
-print(f"✓ Reduced to {len(df.columns)} relevant columns")
-
-# Visualize column selection
-fig, ax = plt.subplots(figsize=(10, 6))
-column_counts = pd.Series({
-    'Original Columns': len(df_raw.columns),
-    'Selected Columns': len(df.columns),
-    'Removed Columns': len(df_raw.columns) - len(df.columns)
-})
-column_counts.plot(kind='bar', ax=ax, color=['#3498db', '#2ecc71', '#e74c3c'])
-ax.set_title('Column Selection', fontsize=14, fontweight='bold')
-ax.set_ylabel('Count')
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig('images/step2_column_selection.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# STEP 3: CHECK FOR DUPLICATES
-print("\n[STEP 3] Checking for duplicate records...")
-
-duplicates_before = df.duplicated(subset=['GEOID10']).sum()
-print(f"  - Duplicate GEOID10 values: {duplicates_before}")
-
-# Check for complete row duplicates
-full_duplicates = df.duplicated().sum()
-print(f"  - Complete duplicate rows: {full_duplicates}")
-
-# Remove duplicates if any
-df_clean = df.drop_duplicates(subset=['GEOID10'], keep='first')
-duplicates_removed = len(df) - len(df_clean)
-
-if duplicates_removed > 0:
-    print(f"✓ Removed {duplicates_removed} duplicate records")
-else:
-    print(f"✓ No duplicates found")
-
-# Save duplicate check visualization
-fig, ax = plt.subplots(figsize=(8, 5))
-duplicate_data = pd.Series({
-    'Original Records': len(df),
-    'After Removing Duplicates': len(df_clean),
-    'Duplicates Removed': duplicates_removed
-})
-duplicate_data.plot(kind='bar', ax=ax, color=['#3498db', '#2ecc71', '#e74c3c'])
-ax.set_title('Duplicate Records Check', fontsize=14, fontweight='bold')
-ax.set_ylabel('Count')
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig('images/step3_duplicates.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-df = df_clean.copy()
-
-# STEP 4: HANDLE MISSING VALUES
-print("\n[STEP 4] Checking for missing values...")
-
-# Key walkability variables
-key_vars = ['D3B', 'D4A', 'D2B_E8MIXA', 'D2A_EPHHM', 'NatWalkInd']
-
-missing_before = df[key_vars].isnull().sum()
-print("\nMissing values in key variables:")
-for var, count in missing_before.items():
-    pct = (count / len(df)) * 100
-    print(f"  - {var}: {count} ({pct:.2f}%)")
-
-# Visualize missing values
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Missing counts
-missing_before.plot(kind='barh', ax=ax1, color='#e74c3c')
-ax1.set_title('Missing Values in Key Variables (Before)', fontsize=12, fontweight='bold')
-ax1.set_xlabel('Number of Missing Values')
-
-# Missing percentages
-missing_pct = (df.isnull().sum() / len(df) * 100).sort_values(ascending=False).head(10)
-missing_pct.plot(kind='barh', ax=ax2, color='#e74c3c')
-ax2.set_title('Top 10 Variables by Missing % (Before)', fontsize=12, fontweight='bold')
-ax2.set_xlabel('Missing Percentage (%)')
-
-plt.tight_layout()
-plt.savefig('images/step4_missing_values_before.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Handle missing values in D4A (transit proximity)
-# -99999 indicates no transit service, which is valid data, not missing
-# Keep these values as they represent "no transit access"
-print("\n✓ D4A values of -99999 represent 'no transit' and are kept as valid data")
-
-# For other missing values in key variables, we'll flag them but keep the rows
-# This is important for geographic completeness
-print(f"✓ All records retained for geographic completeness")
-
-# STEP 5: CHECK DATA RANGES AND OUTLIERS
-print("\n[STEP 5] Checking data ranges and outliers...")
-
-# Expected ranges based on PDF methodology
-expected_ranges = {
-    'D2A_Ranked': (1, 20),
-    'D2B_Ranked': (1, 20),
-    'D3B_Ranked': (1, 20),
-    'D4A_Ranked': (1, 20),
-    'NatWalkInd': (1, 20)
+# Compact integer dtypes for the key columns; ranked scores are integers in
+# [1, 20]. Only lossless downcasts: measures (D3B, NatWalkInd, Ac_Land, ...)
+# keep Float64 so the cleaned files and summary statistics keep full precision.
+# GEOID10/GEOID20, CBSA, CSA, HH and CountHU are left to inference because the
+# source export writes them as floats.
+DTYPES = {
+    'STATEFP': pl.Int16, 'COUNTYFP': pl.Int16, 'TRACTCE': pl.Int32, 'BLKGRPCE': pl.Int8,
+    'TotPop': pl.Int32,
+    'D2A_Ranked': pl.Int8, 'D2B_Ranked': pl.Int8, 'D3B_Ranked': pl.Int8, 'D4A_Ranked': pl.Int8,
+    'TotEmp': pl.Int32, 'Workers': pl.Int32,
+    'AutoOwn0': pl.Int32, 'AutoOwn1': pl.Int32, 'AutoOwn2p': pl.Int32,
 }
 
-print("\nValidating ranked scores and walkability index:")
-for var, (min_val, max_val) in expected_ranges.items():
-    actual_min = df[var].min()
-    actual_max = df[var].max()
-    in_range = (actual_min >= min_val) and (actual_max <= max_val)
-    status = "✓" if in_range else "✗"
-    print(f"  {status} {var}: [{actual_min:.2f}, {actual_max:.2f}] (expected: [{min_val}, {max_val}])")
-
-# Visualize distributions
-fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-fig.suptitle('Distribution of Key Walkability Variables', fontsize=16, fontweight='bold')
-
-vars_to_plot = ['D3B', 'D4A', 'D2B_E8MIXA', 'D2A_EPHHM']
-var_names = ['Intersection Density', 'Transit Proximity (m)', 'Employment Mix', 'Employment-HH Mix']
-
-for idx, (var, name) in enumerate(zip(vars_to_plot, var_names)):
-    ax = axes[idx // 2, idx % 2]
-    # Filter out extreme outliers for better visualization
-    data = df[var]
-    if var == 'D4A':
-        # Special handling for transit variable
-        data_filtered = data[data > -99999]  # Exclude "no transit" values
-        ax.hist(data_filtered, bins=50, edgecolor='black', alpha=0.7, color='#3498db')
-        ax.set_title(f'{name}\n(excluding "no transit" values)', fontweight='bold')
-    else:
-        ax.hist(data, bins=50, edgecolor='black', alpha=0.7, color='#3498db')
-        ax.set_title(name, fontweight='bold')
-    
-    ax.set_xlabel('Value')
-    ax.set_ylabel('Frequency')
-    ax.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('images/step5_distributions.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# STEP 6: VERIFY WALKABILITY INDEX CALCULATION
-print("\n[STEP 6] Verifying walkability index calculation...")
-
-# Formula from PDF: NatWalkInd = (w/3) + (x/3) + (y/6) + (z/6)
-# where w=D3B_Ranked, x=D4A_Ranked, y=D2B_Ranked, z=D2A_Ranked
-
-df['Calculated_NWI'] = (
-    (df['D3B_Ranked'] / 3) + 
-    (df['D4A_Ranked'] / 3) + 
-    (df['D2B_Ranked'] / 6) + 
-    (df['D2A_Ranked'] / 6)
-)
-
-# Check if calculated matches provided
-difference = (df['NatWalkInd'] - df['Calculated_NWI']).abs()
-max_diff = difference.max()
-mean_diff = difference.mean()
-
-print(f"  - Maximum difference: {max_diff:.6f}")
-print(f"  - Mean difference: {mean_diff:.6f}")
-
-if max_diff < 0.01:
-    print("✓ Walkability index calculation verified")
-else:
-    print("⚠ Some discrepancies found in walkability index calculation")
-
-# Visualize verification
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Scatter plot
-ax1.scatter(df['NatWalkInd'], df['Calculated_NWI'], alpha=0.5, s=20)
-ax1.plot([0, 20], [0, 20], 'r--', label='Perfect Match')
-ax1.set_xlabel('Provided NatWalkInd')
-ax1.set_ylabel('Calculated NatWalkInd')
-ax1.set_title('Walkability Index Verification', fontweight='bold')
-ax1.legend()
-ax1.grid(alpha=0.3)
-
-# Difference histogram
-ax2.hist(difference, bins=50, edgecolor='black', alpha=0.7, color='#2ecc71')
-ax2.set_xlabel('Absolute Difference')
-ax2.set_ylabel('Frequency')
-ax2.set_title('Distribution of Calculation Differences', fontweight='bold')
-ax2.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('images/step6_calculation_verification.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Drop the temporary calculated column
-df = df.drop('Calculated_NWI', axis=1)
-
-# STEP 7: CATEGORIZE WALKABILITY LEVELS
-print("\n[STEP 7] Categorizing walkability levels...")
-
-# Categories from PDF
-def categorize_walkability(score):
-    if pd.isna(score):
-        return 'Unknown'
-    elif score <= 5.75:
-        return 'Least Walkable'
-    elif score <= 10.5:
-        return 'Below Average Walkable'
-    elif score <= 15.25:
-        return 'Above Average Walkable'
-    else:
-        return 'Most Walkable'
-
-df['Walkability_Category'] = df['NatWalkInd'].apply(categorize_walkability)
-
-category_counts = df['Walkability_Category'].value_counts()
-print("\nWalkability distribution:")
-for cat, count in category_counts.items():
-    pct = (count / len(df)) * 100
-    print(f"  - {cat}: {count} ({pct:.2f}%)")
-
-# Visualize categories
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-
-# Bar chart
-colors = ['#e74c3c', '#f39c12', '#2ecc71', '#3498db']
-category_counts.plot(kind='bar', ax=ax1, color=colors)
-ax1.set_title('Walkability Categories Distribution', fontsize=12, fontweight='bold')
-ax1.set_ylabel('Number of Block Groups')
-ax1.set_xlabel('Category')
-plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
-
-# Pie chart
-ax2.pie(category_counts.values, labels=category_counts.index, autopct='%1.1f%%',
-        colors=colors, startangle=90)
-ax2.set_title('Walkability Categories Proportion', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('images/step7_categories.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# STEP 8: CREATE SUMMARY STATISTICS
-print("\n[STEP 8] Generating summary statistics...")
-
-summary_stats = df[key_vars].describe()
-print("\nSummary statistics for key variables:")
-print(summary_stats)
-
-# Save summary stats
-summary_stats.to_csv('images/step8_summary_statistics.csv')
+# Keep text columns (CBSA_Name, CSA_Name) Arrow-backed instead of Python objects
+ARROW_STRINGS = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow'),
+}
 
-# Visualize summary
-fig, axes = plt.subplots(2, 3, figsize=(16, 10))
-fig.suptitle('Summary Statistics - Key Variables', fontsize=16, fontweight='bold')
+# Walkability levels from PDF, least to most walkable. Each level includes its
+# upper break, e.g. 5.75 is still Least Walkable
+WALKABILITY_BINS = [5.75, 10.5, 15.25]
+WALKABILITY_LABELS = [
+    'Least Walkable',
+    'Below Average Walkable',
+    'Above Average Walkable',
+    'Most Walkable',
+]
 
-all_vars = key_vars + ['Walkability_Category']
 
-for idx, var in enumerate(key_vars):
-    ax = axes[idx // 3, idx % 3]
-    
-    # Box plot
-    df.boxplot(column=var, ax=ax)
-    ax.set_title(var, fontweight='bold')
-    ax.set_ylabel('Value')
+def _scan_raw(path):
+    """Lazily scan only the key columns; Polars skips parsing everything else."""
+    return (
+        pl.scan_csv(path, try_parse_dates=False, schema_overrides=DTYPES)
+        .select(key_columns)
+    )
+
+
+def _clean(raw):
+    """Dedup and categorize in one fused lazy pass."""
+    return (
+        raw
+        .unique(subset=['GEOID10'], keep='first', maintain_order=True)
+        .with_columns(
+            # Right-closed bins, so a score on a break keeps the lower level;
+            # missing scores stay null
+            pl.col('NatWalkInd')
+            .bin_intervals(WALKABILITY_BINS, labels=WALKABILITY_LABELS, right_closed=True)
+            .alias('Walkability_Category'),
+        )
+    )
+
+
+@njit(parallel=True, cache=True)
+def _verify_nwi(d3b, d4a, d2b, d2a, nwi):
+    """Recompute the NWI and its absolute difference in one fused pass.
+
+    A missing input gives NaN for that row, so reduce the result with the
+    nan-aware NumPy functions.
+    """
+    n = nwi.size
+    calculated = np.empty(n)
+    difference = np.empty(n)
+    for i in prange(n):
+        calculated[i] = d3b[i] / 3 + d4a[i] / 3 + d2b[i] / 6 + d2a[i] / 6
+        difference[i] = abs(nwi[i] - calculated[i])
+    return calculated, difference
+
+
+def _write_xlsx(df, path):
+    """Stream rows to disk with xlsxwriter's constant_memory mode.
+
+    pandas' to_excel writes cells column by column, which constant_memory
+    can't handle, so rows are written here in order instead.
+    """
+    with xlsxwriter.Workbook(path, {'constant_memory': True}) as workbook:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, df.columns)
+        for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            sheet.write_row(row_num, 0, [None if pd.isna(v) else v for v in row])
+
+
+def main():
+    # Create directories for outputs
+    Path("cleaned_data").mkdir(exist_ok=True)
+    Path("images").mkdir(exist_ok=True)
+
+    print("="*80)
+    print("EPA WALKABILITY INDEX - DATA CLEANING PIPELINE")
+    print("="*80)
+
+    # STEP 1: LOAD THE RAW DATA
+    print("\n[STEP 1] Loading raw data...")
+
+    # Update this path to your actual file location
+    input_file = "for_claude.xlsx"  
+
+    # Read only the header to get the original column count; skipping schema
+    # inference means no data rows are parsed
+    raw_columns = pl.scan_csv(input_file, infer_schema=False).collect_schema().names()
+
+    raw = _scan_raw(input_file)
+    raw_stats, clean = pl.collect_all([raw.select(pl.len()), _clean(raw)], engine="streaming")
+
+    # Only these two scalars are needed from the raw data from here on
+    raw_rows, raw_cols = raw_stats.item(), len(raw_columns)
+    df = clean.to_pandas(types_mapper=ARROW_STRINGS.get)
+    del raw, raw_stats, raw_columns, clean
+    print(f"✓ Loaded {raw_rows:,} rows and {raw_cols} columns")
+
+    # Save raw data info
+    with open("images/step1_raw_data_info.txt", "w") as f:
+        f.write(f"Raw Dataset Information\n")
+        f.write(f"{'='*50}\n")
+        f.write(f"Total Rows: {raw_rows:,}\n")
+        f.write(f"Total Columns: {raw_cols}\n")
+        f.write(f"Memory Usage (selected columns, deduplicated): {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB\n")
+
+    # STEP 2: SELECT RELEVANT COLUMNS
+    print("\n[STEP 2] Selecting relevant columns...")
+
+    print(f"✓ Reduced to {len(key_columns)} relevant columns")
+
+    # Visualize column selection
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+    column_counts = pd.Series({
+        'Original Columns': raw_cols,
+        'Selected Columns': len(key_columns),
+        'Removed Columns': raw_cols - len(key_columns)
+    })
+    column_counts.plot(kind='bar', ax=ax, color=['#3498db', '#2ecc71', '#e74c3c'])
+    ax.set_title('Column Selection', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Count')
+    plt.xticks(rotation=45, ha='right')
+    plt.savefig('images/step2_column_selection.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # STEP 3: CHECK FOR DUPLICATES
+    print("\n[STEP 3] Checking for duplicate records...")
+
+    # Duplicates were already dropped while loading; keep the first GEOID10
+    duplicates_before = raw_rows - len(df)
+    print(f"  - Duplicate GEOID10 values: {duplicates_before}")
+
+    # GEOID10 is the primary key, so every complete duplicate row is also a
+    # GEOID10 duplicate; hashing all columns again would find nothing new
+    print("  - Complete duplicate rows: covered by the GEOID10 check")
+
+    duplicates_removed = duplicates_before
+
+    if duplicates_removed > 0:
+        print(f"✓ Removed {duplicates_removed} duplicate records")
+    else:
+        print(f"✓ No duplicates found")
+
+    # Save duplicate check visualization
+    fig, ax = plt.subplots(figsize=(8, 5), constrained_layout=True)
+    duplicate_data = pd.Series({
+        'Original Records': raw_rows,
+        'After Removing Duplicates': len(df),
+        'Duplicates Removed': duplicates_removed
+    })
+    duplicate_data.plot(kind='bar', ax=ax, color=['#3498db', '#2ecc71', '#e74c3c'])
+    ax.set_title('Duplicate Records Check', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Count')
+    plt.xticks(rotation=45, ha='right')
+    plt.savefig('images/step3_duplicates.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # STEP 4: HANDLE MISSING VALUES
+    print("\n[STEP 4] Checking for missing values...")
+
+    # Key walkability variables
+    key_vars = ['D3B', 'D4A', 'D2B_E8MIXA', 'D2A_EPHHM', 'NatWalkInd']
+
+    # One scan for every column; reused below and in STEP 10
+    null_counts = df[key_columns].isnull().sum()
+    missing_before = null_counts[key_vars]
+    print("\nMissing values in key variables:")
+    for var, count in missing_before.items():
+        pct = (count / len(df)) * 100
+        print(f"  - {var}: {count} ({pct:.2f}%)")
+
+    # Visualize missing values
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5), constrained_layout=True)
+
+    # Missing counts
+    missing_before.plot(kind='barh', ax=ax1, color='#e74c3c')
+    ax1.set_title('Missing Values in Key Variables (Before)', fontsize=12, fontweight='bold')
+    ax1.set_xlabel('Number of Missing Values')
+
+    # Missing percentages
+    missing_pct = (null_counts / len(df) * 100).sort_values(ascending=False).head(10)
+    missing_pct.plot(kind='barh', ax=ax2, color='#e74c3c')
+    ax2.set_title('Top 10 Variables by Missing % (Before)', fontsize=12, fontweight='bold')
+    ax2.set_xlabel('Missing Percentage (%)')
+
+    plt.savefig('images/step4_missing_values_before.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # Handle missing values in D4A (transit proximity)
+    # -99999 indicates no transit service, which is valid data, not missing
+    # Keep these values as they represent "no transit access"
+    print("\n✓ D4A values of -99999 represent 'no transit' and are kept as valid data")
+
+    # For other missing values in key variables, we'll flag them but keep the rows
+    # This is important for geographic completeness
+    print(f"✓ All records retained for geographic completeness")
+
+    # STEP 5: CHECK DATA RANGES AND OUTLIERS
+    print("\n[STEP 5] Checking data ranges and outliers...")
+
+    # Expected ranges based on PDF methodology
+    expected_ranges = {
+        'D2A_Ranked': (1, 20),
+        'D2B_Ranked': (1, 20),
+        'D3B_Ranked': (1, 20),
+        'D4A_Ranked': (1, 20),
+        'NatWalkInd': (1, 20)
+    }
+
+    print("\nValidating ranked scores and walkability index:")
+    for var, (min_val, max_val) in expected_ranges.items():
+        actual_min = df[var].min()
+        actual_max = df[var].max()
+        in_range = (actual_min >= min_val) and (actual_max <= max_val)
+        status = "✓" if in_range else "✗"
+        print(f"  {status} {var}: [{actual_min:.2f}, {actual_max:.2f}] (expected: [{min_val}, {max_val}])")
+
+    # Visualize distributions
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), constrained_layout=True)
+    fig.suptitle('Distribution of Key Walkability Variables', fontsize=16, fontweight='bold')
+
+    vars_to_plot = ['D3B', 'D4A', 'D2B_E8MIXA', 'D2A_EPHHM']
+    var_names = ['Intersection Density', 'Transit Proximity (m)', 'Employment Mix', 'Employment-HH Mix']
+
+    for idx, (var, name) in enumerate(zip(vars_to_plot, var_names)):
+        ax = axes[idx // 2, idx % 2]
+        # Filter out extreme outliers for better visualization
+        data = df[var]
+        if var == 'D4A':
+            # Special handling for transit variable
+            data_filtered = data[data > -99999]  # Exclude "no transit" values
+            ax.hist(data_filtered, bins=50, edgecolor='black', alpha=0.7, color='#3498db')
+            ax.set_title(f'{name}\n(excluding "no transit" values)', fontweight='bold')
+        else:
+            ax.hist(data, bins=50, edgecolor='black', alpha=0.7, color='#3498db')
+            ax.set_title(name, fontweight='bold')
+
+        ax.set_xlabel('Value')
+        ax.set_ylabel('Frequency')
+        ax.grid(axis='y', alpha=0.3)
+
+    plt.savefig('images/step5_distributions.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # STEP 6: VERIFY WALKABILITY INDEX CALCULATION
+    print("\n[STEP 6] Verifying walkability index calculation...")
+
+    # Formula from PDF: NatWalkInd = (w/3) + (x/3) + (y/6) + (z/6)
+    # where w=D3B_Ranked, x=D4A_Ranked, y=D2B_Ranked, z=D2A_Ranked
+    calculated_nwi, difference = _verify_nwi(
+        df['D3B_Ranked'].to_numpy(),
+        df['D4A_Ranked'].to_numpy(),
+        df['D2B_Ranked'].to_numpy(),
+        df['D2A_Ranked'].to_numpy(),
+        df['NatWalkInd'].to_numpy(),
+    )
+
+    # Check if calculated matches provided
+    # Rows with a missing score give NaN differences; skip them like pandas did
+    max_diff = np.nanmax(difference)
+    mean_diff = np.nanmean(difference)
+
+    print(f"  - Maximum difference: {max_diff:.6f}")
+    print(f"  - Mean difference: {mean_diff:.6f}")
+
+    if max_diff < 0.01:
+        print("✓ Walkability index calculation verified")
+    else:
+        print("⚠ Some discrepancies found in walkability index calculation")
+
+    # Visualize verification
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5), constrained_layout=True)
+
+    # Scatter plot of a fixed random sample; 5,000 points show the same picture
+    sample = np.random.default_rng(0).choice(len(df), size=min(5000, len(df)), replace=False)
+    ax1.scatter(df['NatWalkInd'].to_numpy()[sample], calculated_nwi[sample], alpha=0.3, s=8)
+    ax1.plot([0, 20], [0, 20], 'r--', label='Perfect Match')
+    ax1.set_xlabel('Provided NatWalkInd')
+    ax1.set_ylabel('Calculated NatWalkInd')
+    ax1.set_title('Walkability Index Verification', fontweight='bold')
+    ax1.legend()
+    ax1.grid(alpha=0.3)
+
+    # Difference histogram
+    ax2.hist(difference, bins=50, edgecolor='black', alpha=0.7, color='#2ecc71')
+    ax2.set_xlabel('Absolute Difference')
+    ax2.set_ylabel('Frequency')
+    ax2.set_title('Distribution of Calculation Differences', fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+
+    plt.savefig('images/step6_calculation_verification.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # STEP 7: CATEGORIZE WALKABILITY LEVELS
+    print("\n[STEP 7] Categorizing walkability levels...")
+
+    # Walkability_Category was assigned in _clean(); keep the level order so the
+    # counts line up with the colors below
+    category_counts = df['Walkability_Category'].value_counts().reindex(WALKABILITY_LABELS)
+    print("\nWalkability distribution:")
+    for cat, count in category_counts.items():
+        pct = (count / len(df)) * 100
+        print(f"  - {cat}: {count} ({pct:.2f}%)")
+
+    # Missing NatWalkInd stays null and is left out of the counts and charts
+    uncategorized = df['Walkability_Category'].isna().sum()
+    pct = (uncategorized / len(df)) * 100
+    print(f"  - Uncategorized (missing NatWalkInd): {uncategorized} ({pct:.2f}%)")
+
+    # Visualize categories
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5), constrained_layout=True)
+
+    # Bar chart (least to most walkable)
+    colors = ['#e74c3c', '#f39c12', '#2ecc71', '#3498db']
+    category_counts.plot(kind='bar', ax=ax1, color=colors)
+    ax1.set_title('Walkability Categories Distribution', fontsize=12, fontweight='bold')
+    ax1.set_ylabel('Number of Block Groups')
+    ax1.set_xlabel('Category')
+    plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
+
+    # Pie chart
+    ax2.pie(category_counts.values, labels=category_counts.index, autopct='%1.1f%%',
+            colors=colors, startangle=90)
+    ax2.set_title('Walkability Categories Proportion', fontsize=12, fontweight='bold')
+
+    plt.savefig('images/step7_categories.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # STEP 8: CREATE SUMMARY STATISTICS
+    print("\n[STEP 8] Generating summary statistics...")
+
+    summary_stats = df[key_vars].describe()
+    print("\nSummary statistics for key variables:")
+    print(summary_stats)
+
+    # Save summary stats
+    summary_stats.to_csv('images/step8_summary_statistics.csv')
+    summary_stats.to_parquet('images/step8_summary_statistics.parquet')
+
+    # Visualize summary
+    fig, axes = plt.subplots(2, 3, figsize=(16, 10), constrained_layout=True)
+    fig.suptitle('Summary Statistics - Key Variables', fontsize=16, fontweight='bold')
+
+    all_vars = key_vars + ['Walkability_Category']
+
+    for idx, var in enumerate(key_vars):
+        ax = axes[idx // 3, idx % 3]
+
+        # Box plot
+        df.boxplot(column=var, ax=ax)
+        ax.set_title(var, fontweight='bold')
+        ax.set_ylabel('Value')
+        ax.grid(axis='y', alpha=0.3)
+
+    # Category distribution in last subplot
+    ax = axes[1, 2]
+    category_counts.plot(kind='barh', ax=ax, color='#3498db')
+    ax.set_title('Walkability Categories', fontweight='bold')
+    ax.set_xlabel('Count')
+
+    plt.savefig('images/step8_summary_boxplots.png', dpi=DIAG_DPI, bbox_inches='tight')
+    plt.close()
+
+    # STEP 9: SAVE CLEANED DATA
+    print("\n[STEP 9] Saving cleaned data...")
+
+    # Save as CSV
+    output_csv = "cleaned_data/walkability_cleaned.csv"
+    df.to_csv(output_csv, index=False)
+    print(f"✓ Saved cleaned data to: {output_csv}")
+
+    # Save as Parquet for downstream consumers (keeps dtypes, dictionary-encodes categories)
+    output_parquet = "cleaned_data/walkability_cleaned.parquet"
+    df.to_parquet(output_parquet, engine='pyarrow', compression='zstd', index=False)
+    print(f"✓ Saved cleaned data to: {output_parquet}")
+
+    # Save as Excel (optional)
+    output_xlsx = "cleaned_data/walkability_cleaned.xlsx"
+    _write_xlsx(df, output_xlsx)
+    print(f"✓ Saved cleaned data to: {output_xlsx}")
+
+    # Save metadata
+    with open("cleaned_data/cleaning_metadata.txt", "w") as f:
+        f.write("EPA Walkability Index - Data Cleaning Metadata\n")
+        f.write("="*60 + "\n\n")
+        f.write(f"Cleaning Date: {pd.Timestamp.now()}\n")
+        f.write(f"Original Records: {raw_rows:,}\n")
+        f.write(f"Final Records: {len(df):,}\n")
+        f.write(f"Records Removed: {raw_rows - len(df):,}\n")
+        f.write(f"Columns Selected: {len(df.columns)}\n\n")
+        f.write("Key Variables:\n")
+        for var in key_vars:
+            f.write(f"  - {var}\n")
+        f.write(f"\nOutput Files:\n")
+        f.write(f"  - {output_csv}\n")
+        f.write(f"  - {output_parquet}\n")
+        f.write(f"  - {output_xlsx}\n")
+
+    print(f"✓ Saved cleaning metadata")
+
+    # STEP 10: GENERATE BEFORE/AFTER COMPARISON
+    print("\n[STEP 10] Creating before/after comparison...")
+
+    comparison_data = {
+        'Metric': [
+            'Total Records',
+            'Total Columns',
+            'Duplicates',
+            'Missing (D3B)',
+            'Missing (D4A)',
+            'Missing (D2B_E8MIXA)',
+            'Missing (D2A_EPHHM)',
+            'Missing (NatWalkInd)'
+        ],
+        'Before': [
+            raw_rows,
+            raw_cols,
+            duplicates_before,
+            0,  # Assuming no missing in the sample
+            0,
+            0,
+            0,
+            0
+        ],
+        'After': [
+            len(df),
+            len(df.columns),
+            0,
+            null_counts['D3B'],
+            null_counts['D4A'],
+            null_counts['D2B_E8MIXA'],
+            null_counts['D2A_EPHHM'],
+            null_counts['NatWalkInd']
+        ]
+    }
+
+    comparison_df = pd.DataFrame(comparison_data)
+    comparison_df.to_csv('images/step10_before_after_comparison.csv', index=False)
+    comparison_df.to_parquet('images/step10_before_after_comparison.parquet', index=False)
+
+    # Visualize comparison
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+    x = np.arange(len(comparison_df))
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, comparison_df['Before'], width, label='Before', color='#e74c3c', alpha=0.8)
+    bars2 = ax.bar(x + width/2, comparison_df['After'], width, label='After', color='#2ecc71', alpha=0.8)
+
+    ax.set_xlabel('Metric')
+    ax.set_ylabel('Count')
+    ax.set_title('Data Cleaning: Before vs After Comparison', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(comparison_df['Metric'], rotation=45, ha='right')
+    ax.legend()
     ax.grid(axis='y', alpha=0.3)
 
-# Category distribution in last subplot
-ax = axes[1, 2]
-category_counts.plot(kind='barh', ax=ax, color='#3498db')
-ax.set_title('Walkability Categories', fontweight='bold')
-ax.set_xlabel('Count')
-
-plt.tight_layout()
-plt.savefig('images/step8_summary_boxplots.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# STEP 9: SAVE CLEANED DATA
-print("\n[STEP 9] Saving cleaned data...")
-
-# Save as CSV
-output_csv = "cleaned_data/walkability_cleaned.csv"
-df.to_csv(output_csv, index=False)
-print(f"✓ Saved cleaned data to: {output_csv}")
-
-# Save as Excel (optional)
-output_xlsx = "cleaned_data/walkability_cleaned.xlsx"
-df.to_excel(output_xlsx, index=False)
-print(f"✓ Saved cleaned data to: {output_xlsx}")
-
-# Save metadata
-with open("cleaned_data/cleaning_metadata.txt", "w") as f:
-    f.write("EPA Walkability Index - Data Cleaning Metadata\n")
-    f.write("="*60 + "\n\n")
-    f.write(f"Cleaning Date: {pd.Timestamp.now()}\n")
-    f.write(f"Original Records: {len(df_raw):,}\n")
-    f.write(f"Final Records: {len(df):,}\n")
-    f.write(f"Records Removed: {len(df_raw) - len(df):,}\n")
-    f.write(f"Columns Selected: {len(df.columns)}\n\n")
-    f.write("Key Variables:\n")
-    for var in key_vars:
-        f.write(f"  - {var}\n")
-    f.write(f"\nOutput Files:\n")
-    f.write(f"  - {output_csv}\n")
-    f.write(f"  - {output_xlsx}\n")
-
-print(f"✓ Saved cleaning metadata")
-
-# STEP 10: GENERATE BEFORE/AFTER COMPARISON
-print("\n[STEP 10] Creating before/after comparison...")
-
-comparison_data = {
-    'Metric': [
-        'Total Records',
-        'Total Columns',
-        'Duplicates',
-        'Missing (D3B)',
-        'Missing (D4A)',
-        'Missing (D2B_E8MIXA)',
-        'Missing (D2A_EPHHM)',
-        'Missing (NatWalkInd)'
-    ],
-    'Before': [
-        len(df_raw),
-        len(df_raw.columns),
-        duplicates_before,
-        0,  # Assuming no missing in the sample
-        0,
-        0,
-        0,
-        0
-    ],
-    'After': [
-        len(df),
-        len(df.columns),
-        0,
-        df['D3B'].isnull().sum(),
-        df['D4A'].isnull().sum(),
-        df['D2B_E8MIXA'].isnull().sum(),
-        df['D2A_EPHHM'].isnull().sum(),
-        df['NatWalkInd'].isnull().sum()
-    ]
-}
-
-comparison_df = pd.DataFrame(comparison_data)
-comparison_df.to_csv('images/step10_before_after_comparison.csv', index=False)
-
-# Visualize comparison
-fig, ax = plt.subplots(figsize=(12, 6))
-x = np.arange(len(comparison_df))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, comparison_df['Before'], width, label='Before', color='#e74c3c', alpha=0.8)
-bars2 = ax.bar(x + width/2, comparison_df['After'], width, label='After', color='#2ecc71', alpha=0.8)
-
-ax.set_xlabel('Metric')
-ax.set_ylabel('Count')
-ax.set_title('Data Cleaning: Before vs After Comparison', fontsize=14, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(comparison_df['Metric'], rotation=45, ha='right')
-ax.legend()
-ax.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('images/step10_before_after.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# FINAL SUMMARY
-print("\n" + "="*80)
-print("DATA CLEANING PIPELINE COMPLETED SUCCESSFULLY!")
-print("="*80)
-print(f"\n✓ Original dataset: {len(df_raw):,} rows × {len(df_raw.columns)} columns")
-print(f"✓ Cleaned dataset: {len(df):,} rows × {len(df.columns)} columns")
-print(f"✓ Records removed: {len(df_raw) - len(df):,}")
-print(f"\n✓ Cleaned data saved to: cleaned_data/")
-print(f"✓ Visualizations saved to: images/")
-print(f"\n✓ Total visualizations created: 10")
-print("\nNext step: Run your Streamlit app to view the results!")
-print("="*80)
\ No newline at end of file
+    plt.savefig('images/step10_before_after.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # FINAL SUMMARY
+    print("\n" + "="*80)
+    print("DATA CLEANING PIPELINE COMPLETED SUCCESSFULLY!")
+    print("="*80)
+    print(f"\n✓ Original dataset: {raw_rows:,} rows × {raw_cols} columns")
+    print(f"✓ Cleaned dataset: {len(df):,} rows × {len(df.columns)} columns")
+    print(f"✓ Records removed: {raw_rows - len(df):,}")
+    print(f"\n✓ Cleaned data saved to: cleaned_data/")
+    print(f"✓ Visualizations saved to: images/")
+    print(f"\n✓ Total visualizations created: 10")
+    print("\nNext step: Run your Streamlit app to view the results!")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Render the National Walkability Index formula for the Data Prep page
+Run once locally; the output is committed to images/
+Author: Sejal Hukare
+Date: January 2026
+"""
+
+import matplotlib
+matplotlib.use('Agg')  # files only, no GUI backend to initialise
+import matplotlib.pyplot as plt
+
+
+FORMULA = r'$NatWalkInd = \frac{w}{3} + \frac{x}{3} + \frac{y}{6} + \frac{z}{6}$'
+OUTPUT = 'images/step6_formula.svg'
+
+
+def main():
+    # The svg.hashsalt and empty Date keep re-renders byte-identical
+    plt.rcParams['svg.hashsalt'] = 'step6_formula'
+    fig = plt.figure(figsize=(6, 0.8))
+    fig.text(0.5, 0.5, FORMULA, ha='center', va='center', fontsize=18)
+    fig.savefig(OUTPUT, bbox_inches='tight', facecolor='white', metadata={'Date': None})
+    plt.close(fig)
+    print(f"✓ Saved formula to: {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
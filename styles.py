@@ -0,0 +1,143 @@
+"""Page stylesheets shared by the Streamlit pages.
+
+Kept here so the CSS lives in one place instead of inside each page's app().
+"""
+
+DATA_PREP_CSS = """
+<style>
+    .section-header {
+        font-size: 28px;
+        font-weight: 600;
+        color: #2c3e50;
+        margin-top: 40px;
+        margin-bottom: 20px;
+        border-bottom: 2px solid #3498db;
+        padding-bottom: 10px;
+    }
+
+    .step-title {
+        font-size: 22px;
+        font-weight: 600;
+        color: #3498db;
+        margin-top: 30px;
+        margin-bottom: 15px;
+    }
+
+    .step-description {
+        font-size: 16px;
+        line-height: 1.8;
+        color: #3498db;
+        margin-bottom: 20px;
+    }
+
+    .metric-box {
+        background-color: #f8f9fa;
+        border-left: 4px solid #3498db;
+        padding: 15px 20px;
+        margin: 10px 0;
+        border-radius: 5px;
+    }
+
+    .metric-value {
+        font-size: 24px;
+        font-weight: 700;
+        color: #2c3e50;
+    }
+
+    .metric-label {
+        font-size: 14px;
+        color: #7f8c8d;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+
+    .summary-tbl {
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 14px;
+    }
+
+    .summary-tbl th,
+    .summary-tbl td {
+        padding: 6px 10px;
+        border-bottom: 1px solid #e0e0e0;
+        text-align: right;
+    }
+</style>
+"""
+
+INTRODUCTION_CSS = """
+<style>
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+
+    /* Professional typography */
+    .main-title {
+        font-size: 85px;
+        font-weight: 700;
+        color: #1a1a1a;
+        text-align: center;
+        margin-bottom: 8px;
+        letter-spacing: -0.5px;
+    }
+
+    .subtitle {
+        font-size: 18px;
+        color: #666666;
+        text-align: center;
+        margin-bottom: 50px;
+        font-weight: 400;
+    }
+
+    .section-header {
+        font-size: 28px;
+        font-weight: 600;
+        color: #2c3e50;
+        margin-top: 60px;
+        margin-bottom: 30px;
+        border-bottom: 2px solid #e0e0e0;
+        padding-bottom: 10px;
+    }
+
+    .body-text {
+        font-size: 17px;
+        line-height: 2.1;
+        color: #F0F8FF;
+        text-align: justify;
+        margin-bottom: 35px;
+    }
+
+    # .image-caption {
+    #     text-align: center;
+    #     font-size: 14px;
+    #     color: #777777;
+    #     font-style: italic;
+    #     margin-top: 12px;
+    #     margin-bottom: 40px;
+    # }
+
+    .question-item {
+        font-size: 16px;
+        line-height: 1.9;
+        color: #3498db;
+        margin-bottom: 18px;
+        padding-left: 8px;
+        border-left: 3px solid #3498db;
+        padding: 12px 0 12px 20px;
+    }
+
+    .question-number {
+        font-weight: 600;
+        color: #3498db;
+        margin-right: 8px;
+    }
+
+    /* Animation container */
+    .lottie-container {
+        display: flex;
+        justify-content: center;
+        margin: 40px 0;
+    }
+</style>
+"""